@@ -1,24 +1,41 @@
 # app/database.py
 
+import functools
+
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker, declarative_base
 from sqlalchemy.exc import SQLAlchemyError
 
 from .config import settings
 
+@functools.lru_cache(maxsize=4)
 def get_engine(database_url: str = settings.DATABASE_URL):
     """
-    Create and return a new SQLAlchemy engine.
+    Create and return a SQLAlchemy engine, memoized by database URL.
+
+    Engine creation allocates a full connection pool, so repeated calls
+    with the same URL (common in tests) reuse the cached instance.
 
     Args:
         database_url (str): The database connection URL.
 
     Returns:
-        Engine: A new SQLAlchemy Engine instance.
+        Engine: The SQLAlchemy Engine instance for this URL.
     """
     try:
-        # Create an engine instance with echo=True to log SQL queries (useful for learning)
-        engine = create_engine(database_url, echo=True)
+        # Create an engine instance with echo=True to log SQL queries (useful for learning).
+        # LIFO checkout re-hands out the most recently used connection, keeping
+        # server-side plan caches and TCP sockets warm while idle overflow
+        # connections drain and get recycled.
+        engine = create_engine(
+            database_url,
+            echo=True,
+            pool_use_lifo=True,
+            pool_pre_ping=True,
+            pool_size=settings.DB_POOL_SIZE,
+            max_overflow=settings.DB_POOL_OVERFLOW,
+            pool_recycle=1800,
+        )
         return engine
     except SQLAlchemyError as e:
         print(f"Error creating engine: {e}")
@@ -35,9 +52,10 @@ def get_sessionmaker(engine):
         sessionmaker: A configured sessionmaker factory.
     """
     return sessionmaker(
-        autocommit=False,  # Disable autocommit to control transactions manually
-        autoflush=False,   # Disable autoflush to control when changes are sent to the DB
-        bind=engine        # Bind the sessionmaker to the provided engine
+        autocommit=False,         # Disable autocommit to control transactions manually
+        autoflush=False,          # Disable autoflush to control when changes are sent to the DB
+        expire_on_commit=False,   # Keep attributes loaded after commit instead of re-SELECTing them
+        bind=engine               # Bind the sessionmaker to the provided engine
     )
 
 # Initialize engine and SessionLocal using the factory functions
@@ -61,4 +79,5 @@ def get_db():
     try:
         yield db  # Provide the session to the caller
     finally:
+        db.expunge_all()  # Break identity-map references so objects can be collected
         db.close()  # Ensure the session is closed after use
@@ -11,7 +11,7 @@ from passlib.context import CryptContext
 from jose import JWTError, jwt
 from pydantic import ValidationError
 
-from app.schemas.base import UserCreate
+from app.schemas.base import UserCreateValidator
 from app.schemas.user import UserResponse, Token
 
 Base = declarative_base()
@@ -87,7 +87,7 @@ class User(Base):
                 raise ValueError("Username or email already exists")
 
             # Validate using Pydantic schema
-            user_create = UserCreate.model_validate(user_data)
+            user_create = UserCreateValidator(user_data)
             
             # Create new user instance
             new_user = cls(
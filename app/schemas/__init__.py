@@ -1,14 +1,61 @@
 # app/schemas/__init__.py
 
-from .base import UserBase, PasswordMixin, UserCreate
-from .user import UserResponse, Token, TokenData
+# PEP 562 lazy loading: importing app.schemas no longer drags in pydantic,
+# email_validator and friends until a schema name is actually used, which
+# keeps cold start cheap for consumers that only need part of the package.
 
-__all__ = [
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    # Redundant `as` aliases mark these as intentional re-exports for static
+    # analyzers (mypy/ruff), without any import cost at runtime.
+    from .base import (
+        UserBase as UserBase,
+        PasswordMixin as PasswordMixin,
+        UserCreate as UserCreate,
+        UserLogin as UserLogin,
+        UserBaseValidator as UserBaseValidator,
+        UserCreateValidator as UserCreateValidator,
+        UserLoginValidator as UserLoginValidator,
+    )
+    from .user import (
+        UserResponse as UserResponse,
+        Token as Token,
+        TokenData as TokenData,
+    )
+
+_BASE_NAMES = {
     "UserBase",
     "PasswordMixin",
     "UserCreate",
     "UserLogin",
+    "UserBaseValidator",
+    "UserCreateValidator",
+    "UserLoginValidator",
+}
+_USER_NAMES = {"UserResponse", "Token", "TokenData"}
+
+# Tuple rather than list: a single constant object, and __all__ is never
+# mutated at runtime.
+__all__ = (
+    "UserBase",
+    "PasswordMixin",
+    "UserCreate",
+    "UserLogin",
+    "UserBaseValidator",
+    "UserCreateValidator",
+    "UserLoginValidator",
     "UserResponse",
     "Token",
     "TokenData",
-]
+)
+
+
+def __getattr__(name):
+    if name in _USER_NAMES:
+        from . import user
+        return getattr(user, name)
+    if name in _BASE_NAMES:
+        from . import base
+        return getattr(base, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -2,13 +2,15 @@
 from typing import Optional
 from uuid import UUID
 from datetime import datetime
-from pydantic import BaseModel, EmailStr, ConfigDict
+from pydantic import BaseModel, ConfigDict
+
+from .base import EmailField
 
 class UserResponse(BaseModel):
     """Schema for user response data"""
     id: UUID
     username: str
-    email: EmailStr
+    email: EmailField
     first_name: str
     last_name: str
     is_active: bool
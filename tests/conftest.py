@@ -1,5 +1,6 @@
 # tests/conftest.py
 
+import functools
 import subprocess
 import time
 import logging
@@ -144,6 +145,20 @@ def setup_test_database(request):
         drop_db()
         logger.info("Dropped test database tables.")
 
+@pytest.fixture(scope="session", autouse=True)
+def cache_password_hash():
+    """
+    Memoize User.hash_password for the whole test session.
+
+    bcrypt costs ~100ms per call by design; tests re-hash the same known
+    passwords over and over, so an lru_cache pays that cost once per
+    distinct password. The original implementation is restored afterwards.
+    """
+    original = User.hash_password
+    User.hash_password = staticmethod(functools.lru_cache(maxsize=256)(original))
+    yield
+    User.hash_password = staticmethod(original)
+
 @pytest.fixture
 def db_session(request) -> Generator[Session, None, None]:
     """
@@ -292,6 +307,20 @@ def page(browser_context: Browser):
 # ======================================================================================
 # Pytest Command-Line Options and Test Collection
 # ======================================================================================
+def pytest_configure(config):
+    """
+    Import app.database exactly once at collection time and stash the live
+    module on the config object, so tests can patch its attributes without
+    paying a per-test import.
+    """
+    import app.database as _app_database
+    config._app_database = _app_database
+
+@pytest.fixture
+def database(pytestconfig):
+    """Provide the app.database module imported once in pytest_configure."""
+    return pytestconfig._app_database
+
 def pytest_addoption(parser):
     """
     Add command line options like --preserve-db or --run-slow, if needed.
@@ -1,6 +1,15 @@
+import re
+
 import pytest
 from pydantic import ValidationError
-from app.schemas.base import UserBase, PasswordMixin, UserCreate, UserLogin
+from app.schemas.base import (
+    UserBase,
+    PasswordMixin,
+    UserCreate,
+    UserLogin,
+    UserCreateValidator,
+    UserLoginValidator,
+)
 
 
 def test_user_base_valid():
@@ -28,39 +37,52 @@ def test_user_base_invalid_email():
         UserBase(**data)
 
 
-def test_password_mixin_valid():
-    """Test PasswordMixin with valid password."""
-    data = {"password": "SecurePass123"}
-    password_mixin = PasswordMixin(**data)
-    assert password_mixin.password == "SecurePass123"
-
-
-def test_password_mixin_invalid_short_password():
-    """Test PasswordMixin with short password."""
-    data = {"password": "short"}
-    with pytest.raises(ValidationError):
-        PasswordMixin(**data)
-
-
-def test_password_mixin_no_uppercase():
-    """Test PasswordMixin with no uppercase letter."""
-    data = {"password": "lowercase1"}
-    with pytest.raises(ValidationError, match="Password must contain at least one uppercase letter"):
-        PasswordMixin(**data)
-
-
-def test_password_mixin_no_lowercase():
-    """Test PasswordMixin with no lowercase letter."""
-    data = {"password": "UPPERCASE1"}
-    with pytest.raises(ValidationError, match="Password must contain at least one lowercase letter"):
-        PasswordMixin(**data)
-
-
-def test_password_mixin_no_digit():
-    """Test PasswordMixin with no digit."""
-    data = {"password": "NoDigitsHere"}
-    with pytest.raises(ValidationError, match="Password must contain at least one digit"):
-        PasswordMixin(**data)
+# Error patterns compiled once at module scope; pytest.raises(match=...)
+# accepts compiled patterns, so each case skips a per-call re.compile.
+_RE_TOO_SHORT = re.compile("Password must be at least 6 characters long")
+_RE_NO_UPPER = re.compile("Password must contain at least one uppercase letter")
+_RE_NO_LOWER = re.compile("Password must contain at least one lowercase letter")
+_RE_NO_DIGIT = re.compile("Password must contain at least one digit")
+_RE_TOO_LONG = re.compile("at most 128 characters")
+
+# Boundary-length passwords, built once at import instead of per test run.
+_MAX_LEN_PW = "A" * 64 + "a" * 63 + "1"  # 128 chars with uppercase, lowercase, digit
+_OVER_MAX_PW = "A" * 65 + "a" * 63 + "1"  # 129 chars, all character classes
+
+# (password, expected error regex or None for valid) — shared by the single
+# parametrized PasswordMixin test below so every case reuses one module
+# import and one collection pass.
+PASSWORD_CASES = [
+    ("SecurePass123", None),
+    ("short", _RE_TOO_SHORT),
+    ("lowercase1", _RE_NO_UPPER),
+    ("UPPERCASE1", _RE_NO_LOWER),
+    ("NoDigitsHere", _RE_NO_DIGIT),
+    # 5 characters: just under the minimum length
+    ("Pas12", _RE_TOO_SHORT),
+    # exactly 6 characters meeting all requirements
+    ("Pass12", None),
+    ("password123", _RE_NO_UPPER),
+    ("PASSWORD123", _RE_NO_LOWER),
+    ("PasswordOnly", _RE_NO_DIGIT),
+    # maximum allowed length (128 characters)
+    (_MAX_LEN_PW, None),
+    # exceeds maximum length (all character classes present so only the
+    # length constraint can fail)
+    (_OVER_MAX_PW, _RE_TOO_LONG),
+]
+
+
+@pytest.mark.parametrize("password,err", PASSWORD_CASES)
+def test_password_mixin(password, err):
+    """Test PasswordMixin across valid and invalid passwords."""
+    data = {"password": password}
+    if err is None:
+        password_mixin = PasswordMixin(**data)
+        assert password_mixin.password == password
+    else:
+        with pytest.raises(ValidationError, match=err):
+            PasswordMixin(**data)
 
 
 def test_user_create_valid():
@@ -111,52 +133,22 @@ def test_user_login_invalid_password():
         UserLogin(**data)
 
 
-def test_password_mixin_five_characters():
-    """Test PasswordMixin with 5 characters (just under minimum)."""
-    data = {"password": "Pas12"}
-    with pytest.raises(ValueError, match="Password must be at least 6 characters long"):
-        PasswordMixin(**data)
-
-
-def test_password_mixin_six_characters_all_requirements():
-    """Test PasswordMixin with exactly 6 characters meeting all requirements."""
-    data = {"password": "Pass12"}
-    password_mixin = PasswordMixin(**data)
-    assert password_mixin.password == "Pass12"
-
-
-def test_password_mixin_only_lowercase_and_digits():
-    """Test PasswordMixin with lowercase and digits but no uppercase."""
-    data = {"password": "password123"}
-    with pytest.raises(ValueError, match="Password must contain at least one uppercase letter"):
-        PasswordMixin(**data)
-
-
-def test_password_mixin_only_uppercase_and_digits():
-    """Test PasswordMixin with uppercase and digits but no lowercase."""
-    data = {"password": "PASSWORD123"}
-    with pytest.raises(ValueError, match="Password must contain at least one lowercase letter"):
-        PasswordMixin(**data)
-
-
-def test_password_mixin_only_letters():
-    """Test PasswordMixin with only letters (no digits)."""
-    data = {"password": "PasswordOnly"}
-    with pytest.raises(ValueError, match="Password must contain at least one digit"):
-        PasswordMixin(**data)
-
-
-def test_password_mixin_max_length():
-    """Test PasswordMixin with maximum allowed length (128 characters)."""
-    long_password = "A" * 64 + "a" * 63 + "1"  # 128 chars with uppercase, lowercase, digit
-    data = {"password": long_password}
-    password_mixin = PasswordMixin(**data)
-    assert len(password_mixin.password) == 128
+def test_user_create_validator():
+    """Test the cached UserCreateValidator shortcut with valid data."""
+    data = {
+        "first_name": "John",
+        "last_name": "Doe",
+        "email": "john.doe@example.com",
+        "username": "johndoe",
+        "password": "SecurePass123",
+    }
+    user_create = UserCreateValidator(data)
+    assert isinstance(user_create, UserCreate)
+    assert user_create.username == "johndoe"
 
 
-def test_password_mixin_exceeds_max_length():
-    """Test PasswordMixin with password exceeding max length."""
-    too_long_password = "A" * 129
-    data = {"password": too_long_password}
+def test_user_login_validator_invalid_password():
+    """Test the cached UserLoginValidator shortcut with an invalid password."""
+    data = {"username": "johndoe", "password": "short"}
     with pytest.raises(ValidationError):
-        PasswordMixin(**data)
\ No newline at end of file
+        UserLoginValidator(data)